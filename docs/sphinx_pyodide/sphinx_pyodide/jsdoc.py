@@ -54,7 +54,7 @@ def has_tag(doclet, tag):
     """Detects whether the doclet comes from a node that has the given modifier
     tag.
     """
-    return ("@" + tag) in doclet.modifier_tags
+    return f"@{tag}" in doclet.modifier_tags
 
 
 # We hide the PyXXXMethods from the documentation and add their children to the
@@ -193,7 +193,7 @@ def doclet_is_private(doclet: ir.TopLevel) -> bool:
         # this via a @private decorator in the documentation comment.
         return True
 
-    if filename in ["module.", "compat.", "types."]:
+    if filename in {"module.", "compat.", "types."}:
         return True
 
     if filename == "pyproxy." and toplevelname.endswith("Methods"):
@@ -42,12 +42,8 @@ def get_packages_summary_directive(app):
                     "version": version,
                 }
 
-            result = []
             columns = ("name", "version")
-            table_markup = self.format_packages_table(packages, columns)
-            result.extend(table_markup)
-
-            return result
+            return self.format_packages_table(packages, columns)
 
         def parse_package_info(
             self, config: pathlib.Path
@@ -93,18 +89,16 @@ def get_packages_summary_directive(app):
             thead.append(row)
             group += thead
 
-            rows = []
+            tbody = nodes.tbody()
             for pkg_info in packages.values():
                 row = nodes.row()
-                rows.append(row)
                 for column in columns:
                     value = pkg_info[column]
                     entry = nodes.entry()
                     entry += nodes.paragraph(text=value)
                     row += entry
+                tbody += row
 
-            tbody = nodes.tbody()
-            tbody.extend(rows)
             group += tbody
 
             return [table_spec, table]